@@ -1,43 +1,232 @@
+import httpx
 import openai
-import threading
-from core.config import OPENAI_API_KEY, SYS_PROMPT, COT_MODEL_ID, MSG_MODEL_ID, IMG_MODEL_ID, COT_MODEL_TEMP, MSG_MODEL_TEMP, IMG_MODEL_TEMP
+import tiktoken
+from core.config import OPENAI_API_KEY, SYS_PROMPT, COT_MODEL_ID, MSG_MODEL_ID, IMG_MODEL_ID, COT_MODEL_TEMP, MSG_MODEL_TEMP, IMG_MODEL_TEMP, CACHE_COMPLETIONS_LEN, CACHE_COMPLETIONS_TIMELIMIT_MINS, OAI_MAX_CONCURRENT_REQUESTS, OAI_MAX_RPM, OAI_MAX_TPM, OAI_MAX_RETRIES
+from core.ratelimit import TokenBucket
+from functools import lru_cache
+from PIL import Image
+import base64
+import hashlib
+import io
 import logging
-from typing import Optional, List, Dict
+import time
+from typing import AsyncIterator, Optional, List, Dict, Tuple
+from urllib.parse import urlsplit, urlunsplit
 import asyncio
 
 logger = logging.getLogger('AsyncOpenAI')
 
+# Static prompts live at module level so every request starts with a byte-identical
+# prefix. OpenAI caches matching prompt prefixes server-side for a few minutes, so
+# keeping the stable text first (and the per-request content last) skips re-prefilling
+# the same tokens on every call.
+_SYS_IMAGE = (
+    "Your purpose is to provide a description of the image content embeded in the message.\n\n"
+    "Provide a succinct description useful for someone who can't see it. "
+    "Include any relevant text or context in the image, but try to keep it concise."
+)
+
+_USR_IMAGE = "What is in this image? Provide a succinct description useful for someone who can't see it."
+
+_SYS_IMAGE_SUMMARY = (
+    "Your purpose is to provide a one-sentence summary of the image content embeded in the message.\n\n"
+    "Provide a single concise sentence useful for someone who can't see it. "
+    "Include the most relevant text or context in the image."
+)
+
+_USR_IMAGE_SUMMARY = "What is in this image? Provide a one-sentence summary useful for someone who can't see it."
+
+_SYS_SUMMARY = (
+    "Your purpose is to provide a concise, succint summary of text descriptions."
+)
+
+_SYS_LINK = (
+    "Your purpose is to describe the content of a webpage based on its URL.\n\n"
+    "Extract any details you can from the names, titles, and descriptions in the URL.\n\n"
+    "While you can't access the page, make an educated guess based on the URL itself.\n\n"
+    "Provide a concise, succint, one-to-two sentence summary of the content that would be useful for someone who can't access the page."
+)
+
+def _usr_summary(description: str) -> str:
+    """Build the user prompt for a text summary request."""
+    return (
+        f"Create a concise, succint, one-to-two-sentence summary for the following description:\n\n"
+        f"{description}\n\n"
+        "Summary:"
+    )
+
+def _usr_link(url: str) -> str:
+    """Build the user prompt for a link summary request."""
+    return (
+        f"Please describe the content of the webpage at the following URL: {url}\n\n"
+        "Description:"
+    )
+
+_SYS_CONTENT_TYPE = (
+    "Based on the most recent message, reply with one word that best describes the type of response that would be most relevant and helpful: 'message', 'GIF', 'research', 'youtube', or 'website'.\n\n"
+    "Rules:\n"
+    "1. If the user explicitly requests a GIF (e.g., 'send me a GIF', 'respond with a GIF', or 'can you find a funny GIF about this'), always respond with 'GIF'.\n"
+    "2. If the context suggests a reaction (e.g., something funny, shocking, or emotional), or if a GIF would add a playful or expressive touch to the conversation, respond with 'GIF'.\n"
+    "3. If the user explicitly requests a YouTube video (e.g., 'find a YouTube video', 'show me a video about this', or 'send me a tutorial video'), respond with 'youtube'.\n"
+    "4. If the user explicitly requests a website (e.g., 'find me a website', 'show me an article', or 'look up a site about this'), respond with 'website'.\n"
+    "5. If the user asks about lore, strategies, metas, guides, current topics, tutorials, popular culture, articles, explanations of trends, or anything that would benefit from additional context or in-depth information, respond with 'research'.\n"
+    "6. For personal stories, advice, explanations, casual back-and-forth conversations, or general replies that don’t clearly fit another type, respond with 'message'.\n\n"
+    "Important:\n"
+    "- The default response type is 'message' if none of the above criteria apply.\n"
+    "- Do not provide any additional text or explanations.\n"
+    "- **ONLY REPLY WITH ONE OF THE FOLLOWING WORDS:** message, GIF, research, youtube, or website."
+)
+
+_USR_CONTENT_TYPE = (
+    "Now determine the content type of your response: message, GIF, research, youtube, or website."
+)
+
+_CONTENT_TYPES = ("message", "GIF", "research", "youtube", "website")
+
+# Prebuilt head/tail for determine_content_type so the hot path concatenates
+# tuples instead of re-allocating the same dicts on every call
+_CONTENT_TYPE_HEAD = ({"role": "system", "content": _SYS_CONTENT_TYPE},)
+_CONTENT_TYPE_TAIL = ({"role": "user", "content": _USR_CONTENT_TYPE},)
+
+# Images are downscaled and sent with detail=low, which OpenAI bills at a flat
+# 85 tokens per image regardless of resolution.
+_IMAGE_PART_EST_TOKENS = 85
+_IMAGE_MAX_DIM = 512
+_IMAGE_JPEG_QUALITY = 80
+
+def _downscale_image_to_b64(image_bytes: bytes) -> str:
+    """Downscale an image and return it as base64-encoded JPEG.
+
+    Discord attachments are often >1MB; shrinking to 512px JPEG before base64
+    encoding cuts the request body by an order of magnitude, and pairs with
+    detail=low so the vision model skips high-res tiling entirely.
+    """
+    img = Image.open(io.BytesIO(image_bytes))
+    img.thumbnail((_IMAGE_MAX_DIM, _IMAGE_MAX_DIM))
+    buffer = io.BytesIO()
+    img.convert("RGB").save(buffer, "JPEG", quality=_IMAGE_JPEG_QUALITY, optimize=True)
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+def _build_messages(system: str, user: str, image_b64: Optional[str] = None) -> List[Dict]:
+    """Assemble the system + user message pair shared by the summarizer endpoints."""
+    if image_b64 is None:
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user}
+        ]
+    return [
+        {"role": "system", "content": system},
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": user
+                },
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:image/jpeg;base64,{image_b64}", "detail": "low"}
+                }
+            ]
+        }
+    ]
+
+_encodings: Dict[str, tiktoken.Encoding] = {}
+
+def _encoding_for(model_id: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding for a model, falling back to cl100k_base for unknown IDs."""
+    encoding = _encodings.get(model_id)
+    if encoding is None:
+        try:
+            encoding = tiktoken.encoding_for_model(model_id)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        _encodings[model_id] = encoding
+    return encoding
+
+@lru_cache(maxsize=1024)
+def _token_len(model_id: str, text: str) -> int:
+    """Token count for a piece of text, memoized so the static prompts (and any
+    repeated inputs) are only tokenized once instead of on every request."""
+    return len(_encoding_for(model_id).encode(text))
+
 class OpenAIClient:
     _instance = None
-    _lock = threading.Lock()  # Lock object to ensure thread safety
+    _init_lock: Optional[asyncio.Lock] = None  # Created lazily; guards first-time async_init
 
     def __new__(cls, *args, **kwargs):
-        """Ensure only one instance of OpenAIClient is created, even in a multithreaded context."""
+        """Ensure only one instance of OpenAIClient is created.
+
+        The bot runs on a single event loop, so a plain check is enough here;
+        get_instance() is called on every message and doesn't need to pay for a
+        threading mutex.
+        """
         if cls._instance is None:
-            with cls._lock:  # Lock this section to prevent race conditions
-                if cls._instance is None:  # Double-check locking
-                    cls._instance = super(OpenAIClient, cls).__new__(cls)
-                    cls._instance._initialized = False  # Set initialization flag
+            cls._instance = super(OpenAIClient, cls).__new__(cls)
+            cls._instance._initialized = False  # Set initialization flag
         return cls._instance
 
     async def async_init(self):
         """Asynchronous initialization for the OpenAIClient."""
-        if not self._initialized:  # Check if initialization is needed
-            async with asyncio.Lock():  # Ensure thread-safe async initialization
-                if not self._initialized:  # Double-check inside the lock
-                    self.client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+        if self._initialized:  # Already initialized, nothing to do
+            return
+
+        # The lock must be shared across callers -- constructing a fresh
+        # asyncio.Lock() per call would guard nothing. It's created lazily so no
+        # event loop is needed at import time; the plain check-and-set is safe
+        # because asyncio tasks only interleave at await points.
+        if OpenAIClient._init_lock is None:
+            OpenAIClient._init_lock = asyncio.Lock()
+
+        async with OpenAIClient._init_lock:
+            if self._initialized:  # A concurrent caller finished init while we waited
+                return
+            # Tune the transport instead of using the SDK default: a large
+            # keep-alive pool amortizes TLS/TCP setup across calls to
+            # api.openai.com, and HTTP/2 multiplexes concurrent requests
+            # over the connections that remain.
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=OAI_MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=OAI_MAX_CONCURRENT_REQUESTS,
+                    keepalive_expiry=300
+                ),
+                http2=True,
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+            self.client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+
+            # Set model attributes
+            self.chain_of_thought_model_id = COT_MODEL_ID
+            self.chain_of_thought_temp = COT_MODEL_TEMP
 
-                    # Set model attributes
-                    self.chain_of_thought_model_id = COT_MODEL_ID
-                    self.chain_of_thought_temp = COT_MODEL_TEMP
+            self.message_model_id = MSG_MODEL_ID
+            self.message_model_temp = MSG_MODEL_TEMP
 
-                    self.message_model_id = MSG_MODEL_ID
-                    self.message_model_temp = MSG_MODEL_TEMP
+            self.image_model_id = IMG_MODEL_ID
+            self.image_model_temp = IMG_MODEL_TEMP
 
-                    self.image_model_id = IMG_MODEL_ID
-                    self.image_model_temp = IMG_MODEL_TEMP
+            # Completion cache for the summarizer endpoints, keyed on (model, temp, input).
+            # Repeated Discord links and re-posted descriptions are common, so a
+            # short-lived cache skips the whole network + inference round-trip.
+            self._completion_cache: Dict[bytes, Tuple[float, str]] = {}
 
-                    self._initialized = True  # Mark instance as initialized
+            # In-flight requests keyed like the completion cache. Concurrent callers
+            # for the same input await one shared future instead of each paying for
+            # their own API call.
+            self._inflight: Dict[bytes, asyncio.Future] = {}
+
+            # Shared throttles for every completion request: the semaphore bounds
+            # concurrency, the token bucket keeps us under the RPM/TPM limits.
+            self._sem = asyncio.Semaphore(OAI_MAX_CONCURRENT_REQUESTS)
+            self._bucket = TokenBucket(max_rpm=OAI_MAX_RPM, max_tpm=OAI_MAX_TPM)
+
+            # Bias content-type classification hard toward the first token of
+            # each label so one decode step always lands in-set.
+            encoding = _encoding_for(self.chain_of_thought_model_id)
+            self._content_type_logit_bias = {encoding.encode(label)[0]: 100 for label in _CONTENT_TYPES}
+
+            self._initialized = True  # Mark instance as initialized
 
     @classmethod
     async def create(cls):
@@ -55,148 +244,298 @@ class OpenAIClient:
                 "OpenAIClient must be initialized asynchronously using `await OpenAIClient.create()` before accessing it."
             )
         return instance
-        
-    async def image_describer(self, base64_str: str) -> str:
-        """Given a base64 encoded image, request a description from OpenAI."""
-        try:                    
-            # Prepare and send the request to OpenAI for image analysis
-            system_prompt = (
-                "Your purpose is to provide a description of the image content embeded in the message.\n\n"
-                "Provide a succinct description useful for someone who can't see it. "
-                "Include any relevant text or context in the image, but try to keep it concise."
-            )
-            user_prompt = f"What is in this image? Provide a succinct description useful for someone who can't see it."
-
-            response = await self.client.chat.completions.create(
-                model=self.image_model_id,
-                messages=[
-                    { "role" : "system", "content" : system_prompt },
-                    { 
-                        "role" : "user", 
-                        "content" : [
-                            {
-                                "type": "text",
-                                "text": user_prompt
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {"url": f"data:image/jpeg;base64,{base64_str}"}
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=300,
-                temperature=self.image_model_temp
-            )
-            
-            # Retrieve and return the result from OpenAI
-            result = response.choices[0].message.content if response.choices else "No description available"
-            logger.debug(f"Image description: {result}")
+
+    # ------------------ Completion Requests ------------------
+
+    @staticmethod
+    def _estimate_tokens(model_id: str, messages: List[Dict], max_tokens: int) -> int:
+        """Estimate the total prompt + completion tokens for a request."""
+        est_tokens = max_tokens
+        for message in messages:
+            content = message.get("content", "")
+            if isinstance(content, str):
+                est_tokens += _token_len(model_id, content)
+            else:
+                # Vision content: tokenize the text parts, flat-rate the image parts
+                for part in content:
+                    if part.get("type") == "text":
+                        est_tokens += _token_len(model_id, part.get("text", ""))
+                    else:
+                        est_tokens += _IMAGE_PART_EST_TOKENS
+        return est_tokens
+
+    async def _create_completion(self, **kwargs):
+        """Create a chat completion under the shared concurrency and rate limits.
+
+        Transient errors (rate limits, connection drops, timeouts) are retried with
+        exponential backoff; the last attempt re-raises for the caller to handle.
+        """
+        est_tokens = self._estimate_tokens(kwargs["model"], kwargs["messages"], kwargs.get("max_tokens", 0))
+        for attempt in range(OAI_MAX_RETRIES):
+            await self._bucket.acquire(est_tokens)
+            async with self._sem:
+                try:
+                    return await self.client.chat.completions.create(**kwargs)
+                except (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError) as e:
+                    if attempt == OAI_MAX_RETRIES - 1:
+                        raise
+                    logger.warning("Transient OpenAI error (attempt %s/%s): %s. Retrying.", attempt + 1, OAI_MAX_RETRIES, e)
+            await asyncio.sleep(2**attempt)  # Exponential backoff
+
+    async def _stream_completion(self, **kwargs) -> AsyncIterator[str]:
+        """Stream a chat completion under the shared concurrency and rate limits.
+
+        Yields content deltas as they arrive, so callers can start rendering at the
+        first token instead of waiting for the full generation. Transient errors are
+        retried only before the first chunk; mid-stream errors propagate.
+        """
+        est_tokens = self._estimate_tokens(kwargs["model"], kwargs["messages"], kwargs.get("max_tokens", 0))
+        for attempt in range(OAI_MAX_RETRIES):
+            await self._bucket.acquire(est_tokens)
+            async with self._sem:  # Held while streaming -- the request stays active until the last chunk
+                try:
+                    stream = await self.client.chat.completions.create(stream=True, **kwargs)
+                except (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError) as e:
+                    if attempt == OAI_MAX_RETRIES - 1:
+                        raise
+                    logger.warning("Transient OpenAI error (attempt %s/%s): %s. Retrying.", attempt + 1, OAI_MAX_RETRIES, e)
+                else:
+                    async for chunk in stream:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            yield delta
+                    return
+            await asyncio.sleep(2**attempt)  # Exponential backoff
+
+    # ------------------ Completion Caching ------------------
+
+    @staticmethod
+    def _cache_key(model_id: str, temp: float, payload: str) -> bytes:
+        """Build a stable cache key for a completion request."""
+        return hashlib.blake2b(f"{model_id}|{temp}|{payload}".encode()).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        """Return the cached completion for the key, or None if missing/expired."""
+        entry = self._completion_cache.get(key)
+        if not entry:
+            return None
+        cached_at, result = entry
+        if time.monotonic() - cached_at > CACHE_COMPLETIONS_TIMELIMIT_MINS * 60:
+            del self._completion_cache[key]
+            return None
+        return result
+
+    def _cache_put(self, key: bytes, result: str):
+        """Cache a completion, evicting the oldest entry once the cache is full."""
+        if len(self._completion_cache) >= CACHE_COMPLETIONS_LEN:
+            oldest = min(self._completion_cache, key=lambda k: self._completion_cache[k][0])
+            del self._completion_cache[oldest]
+        self._completion_cache[key] = (time.monotonic(), result)
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Strip query strings and fragments so trivially different links share a cache entry."""
+        parsed = urlsplit(url)
+        return urlunsplit((parsed.scheme, parsed.netloc, parsed.path, "", ""))
+
+    async def _single_flight(self, key: bytes, request) -> str:
+        """Coalesce concurrent requests for the same key into a single API call.
+
+        The first caller runs `request` and publishes the result on a shared future;
+        later callers for the same key await that future instead of issuing their
+        own call. No lock is needed: asyncio tasks only yield at await points, so
+        the dict check-and-set below is atomic.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("Coalescing duplicate in-flight request.")
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await request()
+            future.set_result(result)
             return result
         except Exception as e:
-            logger.error(f"Error processing image content: {str(e)}")
-            return "No description available"
+            future.set_exception(e)
+            raise
+        finally:
+            # If the leading task was cancelled mid-request, the CancelledError
+            # bypasses the except above; cancel the future so coalesced waiters
+            # are released instead of hanging on a forever-pending await
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    async def _chat(self, system: str, user: str, *, model: str, temp: float, max_tokens: int,
+                    image_bytes: Optional[bytes] = None, cache_key_payload: str, fallback: str) -> str:
+        """Single buffered call path for the summarizer endpoints.
+
+        Streams the completion into a string, deduplicating concurrent callers via
+        single-flight and serving repeats from the completion cache. Throttling,
+        retries, and rate accounting all live in the helpers underneath, so every
+        optimization applies to each endpoint through this one path.
+        """
+        key = self._cache_key(model, temp, cache_key_payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("Completion cache hit for payload: %s", cache_key_payload[:50])
+            return cached
+
+        # PIL raises OSError subclasses for undecodable images, so the image
+        # endpoints fall back on those as well
+        expected_errors = (openai.OpenAIError, OSError) if image_bytes is not None else (openai.OpenAIError,)
+
+        async def request() -> str:
+            try:
+                parts = []
+                async for delta in self._chat_stream(system, user, model=model, temp=temp,
+                                                     max_tokens=max_tokens, image_bytes=image_bytes):
+                    parts.append(delta)
+                if not parts:
+                    return fallback
+                result = "".join(parts).strip()
+                logger.debug("Chat completion result: %s", result)
+                self._cache_put(key, result)
+                return result
+            except expected_errors as e:
+                logger.error("Error completing chat request: %s", str(e))
+                return fallback
+
+        return await self._single_flight(key, request)
+
+    async def _chat_stream(self, system: str, user: str, *, model: str, temp: float,
+                           max_tokens: int, image_bytes: Optional[bytes] = None) -> AsyncIterator[str]:
+        """Streaming counterpart of _chat, yielding text fragments as OpenAI generates them."""
+        # Decode + re-encode of a multi-MB attachment is CPU-bound; run it in a
+        # worker thread so it doesn't stall every other task on the event loop
+        image_b64 = await asyncio.to_thread(_downscale_image_to_b64, image_bytes) if image_bytes is not None else None
+        async for delta in self._stream_completion(
+            model=model,
+            messages=_build_messages(system, user, image_b64),
+            max_tokens=max_tokens,
+            temperature=temp
+        ):
+            yield delta
+
+    async def image_describer(self, image_bytes: bytes) -> str:
+        """Given raw image bytes, request a description from OpenAI."""
+        return await self._chat(
+            _SYS_IMAGE, _USR_IMAGE,
+            model=self.image_model_id,
+            temp=self.image_model_temp,
+            max_tokens=300,
+            image_bytes=image_bytes,
+            cache_key_payload="describe|" + hashlib.blake2b(image_bytes).hexdigest(),
+            fallback="No description available"
+        )
+
+    async def image_describer_stream(self, image_bytes: bytes) -> AsyncIterator[str]:
+        """Stream an image description, yielding text fragments as OpenAI generates them."""
+        async for delta in self._chat_stream(_SYS_IMAGE, _USR_IMAGE,
+                                             model=self.image_model_id,
+                                             temp=self.image_model_temp,
+                                             max_tokens=300,
+                                             image_bytes=image_bytes):
+            yield delta
+
+    async def image_summary(self, image_bytes: bytes) -> str:
+        """Given raw image bytes, request a one-sentence summary from OpenAI.
+
+        Fuses the image_describer -> text_summarizer chain into a single call:
+        same logical output, half the round-trips and tokens.
+        """
+        return await self._chat(
+            _SYS_IMAGE_SUMMARY, _USR_IMAGE_SUMMARY,
+            model=self.image_model_id,
+            temp=self.image_model_temp,
+            max_tokens=60,
+            image_bytes=image_bytes,
+            cache_key_payload="summary|" + hashlib.blake2b(image_bytes).hexdigest(),
+            fallback="No summary available"
+        )
 
     async def text_summarizer(self, description: str) -> str:
-        try:
-            system_prompt = (
-                "Your purpose is to provide a concise, succint summary of text descriptions."
-            )
+        """Given a text description, request a one-to-two-sentence summary from OpenAI."""
+        return await self._chat(
+            _SYS_SUMMARY, _usr_summary(description),
+            model=self.chain_of_thought_model_id,
+            temp=self.chain_of_thought_temp,
+            max_tokens=100,
+            cache_key_payload=description,
+            fallback="No summary available"
+        )
+
+    async def text_summarizer_stream(self, description: str) -> AsyncIterator[str]:
+        """Stream a description summary, yielding text fragments as OpenAI generates them."""
+        async for delta in self._chat_stream(_SYS_SUMMARY, _usr_summary(description),
+                                             model=self.chain_of_thought_model_id,
+                                             temp=self.chain_of_thought_temp,
+                                             max_tokens=100):
+            yield delta
 
-            user_prompt = (
-                f"Create a concise, succint, one-to-two-sentence summary for the following description:\n\n"
-                f"{description}\n\n"
-                "Summary:"
-            )
-            response = await self.client.chat.completions.create(
-                model=self.chain_of_thought_model_id,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=100,
-                temperature=self.chain_of_thought_temp
-            )
-            summary = response.choices[0].message.content.strip() if response.choices else "No summary available"
-            return summary
-        except Exception as e:
-            logger.error(f"Error summarizing description: {str(e)}")
-            return "No summary available"
-        
     async def link_summarizer(self, url: str) -> str:
-        try:
-            system_prompt = (
-                "Your purpose is to describe the content of a webpage based on its URL.\n\n"
-                "Extract any details you can from the names, titles, and descriptions in the URL.\n\n"
-                "While you can't access the page, make an educated guess based on the URL itself.\n\n"
-                "Provide a concise, succint, one-to-two sentence summary of the content that would be useful for someone who can't access the page."
-            )
+        """Given a URL, request a short summary of the linked page from OpenAI."""
+        return await self._chat(
+            _SYS_LINK, _usr_link(url),
+            model=self.chain_of_thought_model_id,
+            temp=self.chain_of_thought_temp,
+            max_tokens=50,
+            cache_key_payload=self._normalize_url(url),
+            fallback="No summary available"
+        )
+
+    async def link_summarizer_stream(self, url: str) -> AsyncIterator[str]:
+        """Stream a URL summary, yielding text fragments as OpenAI generates them."""
+        async for delta in self._chat_stream(_SYS_LINK, _usr_link(url),
+                                             model=self.chain_of_thought_model_id,
+                                             temp=self.chain_of_thought_temp,
+                                             max_tokens=50):
+            yield delta
+
+    async def image_describer_batch(self, images: List[bytes]) -> List[str]:
+        """Describe several images concurrently, preserving input order."""
+        return await asyncio.gather(*(self.image_describer(image_bytes) for image_bytes in images))
+
+    async def text_summarizer_batch(self, descriptions: List[str]) -> List[str]:
+        """Summarize several descriptions concurrently, preserving input order."""
+        return await asyncio.gather(*(self.text_summarizer(description) for description in descriptions))
+
+    async def link_summarizer_batch(self, urls: List[str]) -> List[str]:
+        """Summarize several URLs concurrently, preserving input order."""
+        return await asyncio.gather(*(self.link_summarizer(url) for url in urls))
 
-            user_prompt = (
-                f"Please describe the content of the webpage at the following URL: {url}\n\n"
-                "Description:"
-            )
-            response = await self.client.chat.completions.create(
-                model=self.chain_of_thought_model_id,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=50,
-                temperature=self.chain_of_thought_temp
-            )
-            summary = response.choices[0].message.content.strip() if response.choices else "No summary available"
-            return summary
-        except Exception as e:
-            logger.error(f"Error summarizing description: {str(e)}")
-            return "No summary available"
-        
     async def determine_content_type(self, OAI_messages: List[Dict]) -> Optional[str]:
         """Given a list of OpenAI messages, determine the content type the assistant should respond with."""
-        system_prompt = (
-            "Based on the most recent message, reply with one word that best describes the type of response that would be most relevant and helpful: 'message', 'GIF', 'research', 'youtube', or 'website'.\n\n"
-            "Rules:\n"
-            "1. If the user explicitly requests a GIF (e.g., 'send me a GIF', 'respond with a GIF', or 'can you find a funny GIF about this'), always respond with 'GIF'.\n"
-            "2. If the context suggests a reaction (e.g., something funny, shocking, or emotional), or if a GIF would add a playful or expressive touch to the conversation, respond with 'GIF'.\n"
-            "3. If the user explicitly requests a YouTube video (e.g., 'find a YouTube video', 'show me a video about this', or 'send me a tutorial video'), respond with 'youtube'.\n"
-            "4. If the user explicitly requests a website (e.g., 'find me a website', 'show me an article', or 'look up a site about this'), respond with 'website'.\n"
-            "5. If the user asks about lore, strategies, metas, guides, current topics, tutorials, popular culture, articles, explanations of trends, or anything that would benefit from additional context or in-depth information, respond with 'research'.\n"
-            "6. For personal stories, advice, explanations, casual back-and-forth conversations, or general replies that don’t clearly fit another type, respond with 'message'.\n\n"
-            "Important:\n"
-            "- The default response type is 'message' if none of the above criteria apply.\n"
-            "- Do not provide any additional text or explanations.\n"
-            "- **ONLY REPLY WITH ONE OF THE FOLLOWING WORDS:** message, GIF, research, youtube, or website."
-        )
-
-        affix_prompt = (
-            "Now determine the content type of your response: message, GIF, research, youtube, or website."
-        )
-        
-        # Prefix the messages with the system prompt
-        messages = [
-            {"role": "system", "content": system_prompt},
-            *OAI_messages,
-            {"role": "user", "content": affix_prompt}
-        ]
+        # Keep the stable system prompt as the strict prefix and the volatile
+        # conversation last so the cached prefix survives across calls
+        messages = _CONTENT_TYPE_HEAD + tuple(OAI_messages) + _CONTENT_TYPE_TAIL
 
-        # Send the messages to OpenAI for processing
+        # Send the messages to OpenAI for processing. The logit bias restricts the
+        # single output token to the start of one of the labels, so one decode step
+        # replaces up to 10 and the reply can't wander out-of-set.
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.chain_of_thought_model_id,
                 messages=messages,
-                max_tokens=10,
+                max_tokens=1,
+                logit_bias=self._content_type_logit_bias,
                 temperature=self.chain_of_thought_temp
             )
-            content_type = response.choices[0].message.content.strip().lower()
+            content = response.choices[0].message.content if response.choices else None
+            content = content.strip().lower() if content is not None else ""
 
-            if content_type in ["message", "gif", "research", "youtube", "website"]:
-                return content_type
-            else:
-                logger.error(f"Invalid content type '{content_type}'")
-                return "message"  # Default to 'message' on invalid output
-                
-        except Exception as e:
-            logger.error(f"Error determining content type: {e}")
+            # Map the (possibly partial) token back to its full label
+            for content_type in _CONTENT_TYPES:
+                if content and content_type.lower().startswith(content):
+                    return content_type.lower()
+
+            logger.error("Invalid content type '%s'", content)
+            return "message"  # Default to 'message' on invalid output
+
+        except openai.OpenAIError as e:
+            logger.error("Error determining content type: %s", e)
             return "message"  # Default to 'message' on error
 
     async def generate_message_response(self, OAI_messages: List[Dict], research_note=None) -> Optional[str]:
@@ -229,15 +568,19 @@ class OpenAIClient:
             
         # Send to OpenAI for a response
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.message_model_id,
                 messages=messages,
                 max_tokens=300,
                 temperature=self.message_model_temp
             )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error processing message response: {e}")
+            content = response.choices[0].message.content if response.choices else None
+            if content is None:  # Empty choices or content-filtered completion
+                logger.error("Empty message response from OpenAI. Defaulting to None.")
+                return None
+            return content.strip()
+        except openai.OpenAIError as e:
+            logger.error("Error processing message response: %s", e)
             return None
 
     async def generate_search_query(self, content_type: str, OAI_messages: List[Dict]) -> Optional[str]:
@@ -284,15 +627,19 @@ class OpenAIClient:
 
         # Send to OpenAI for a response
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.chain_of_thought_model_id,
                 messages=messages,
                 max_tokens=50,
                 temperature=self.message_model_temp
             )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error processing search query: {e}")
+            content = response.choices[0].message.content if response.choices else None
+            if content is None:  # Empty choices or content-filtered completion
+                logger.error("Empty search query response from OpenAI. Defaulting to None.")
+                return None
+            return content.strip()
+        except openai.OpenAIError as e:
+            logger.error("Error processing search query: %s", e)
             return None
 
     async def is_followup_required(self, OAI_messages: List[Dict]) -> bool:
@@ -317,20 +664,21 @@ class OpenAIClient:
 
         # Send to OpenAI for a response
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.chain_of_thought_model_id,
                 messages=messages,
                 max_tokens=10,
                 temperature=self.chain_of_thought_temp
             )
-            content = response.choices[0].message.content.strip().lower()
+            content = response.choices[0].message.content if response.choices else None
+            content = content.strip().lower() if content is not None else ""
             if content in ["yes", "no"]:
                 return content == "yes"
             else:
-                logger.error(f"Invalid response content: {content}. Defaulting to 'no'.")
+                logger.error("Invalid response content: %s. Defaulting to 'no'.", content)
                 return False
-        except Exception as e:
-            logger.error(f"Error determining follow-up requirement: {e}")
+        except openai.OpenAIError as e:
+            logger.error("Error determining follow-up requirement: %s", e)
             return False
 
     async def select_most_relevant_media(self, query: str, media_descriptions: List[str], OAI_messages: List[Dict]) -> int:
@@ -366,22 +714,23 @@ class OpenAIClient:
 
         # Send to OpenAI for a response
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.chain_of_thought_model_id,
                 messages=messages,
                 max_tokens=10,
                 temperature=self.chain_of_thought_temp
             )
-            content = response.choices[0].message.content.strip()
+            content = response.choices[0].message.content if response.choices else None
+            content = content.strip() if content is not None else ""
 
             # Validate and convert to index
             if content.isdigit():
                 index = int(content)
                 if 1 <= index <= len(media_descriptions):  # Ensure it's within the valid range
                     return index - 1
-            logger.error(f"Invalid response content: {content}")
-        except Exception as e:
-            logger.error(f"Error selecting most relevant media: {e}")
+            logger.error("Invalid response content: %s", content)
+        except openai.OpenAIError as e:
+            logger.error("Error selecting most relevant media: %s", e)
 
         # Default fallback
         return 0
\ No newline at end of file
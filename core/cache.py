@@ -50,12 +50,13 @@ class GLCache:
                 # 2. Process the message
                 gl_message = await self.add_discord_message(message)
                 if not gl_message:
-                    logger.error(f"Empty message for user {message.author.name}. Skipping.")
+                    logger.error("Empty message for user %s. Skipping.", message.author.name)
                     continue
                 
-        # Threads initialized successfully
-        for thread in self.threads.values():
-            logger.info(f"Threads:\n_________________\n{thread}\n_________________\n")
+        # Threads initialized successfully (guarded -- str(thread) renders the whole history)
+        if logger.isEnabledFor(logging.INFO):
+            for thread in self.threads.values():
+                logger.info("Threads:\n_________________\n%s\n_________________\n", thread)
 
         logger.info("Threads initialized.")
         return True 
@@ -108,11 +109,12 @@ class GLCache:
                 # Check for duplicates before adding
                 if not target_thread.contains_message(gl_message.message_id):
                     if not target_thread.add_message(gl_message):
-                        logger.error(f"Failed to add message {gl_message.message_id} to conversation for user {user_id}.")
+                        logger.error("Failed to add message %s to conversation for user %s.", gl_message.message_id, user_id)
                         return None
                 else:
-                    logger.debug(f"Message {gl_message.message_id} already exists in conversation for user {user_id}.")
+                    logger.debug("Message %s already exists in conversation for user %s.", gl_message.message_id, user_id)
 
-        # Step 5: Log success
-        logger.info(f"Added full thread to all participants' threads: {[m[1].content[:50] for m in full_thread]}")
+        # Step 5: Log success (guarded -- building the preview list isn't free on the hot path)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Added full thread to all participants' threads: %s", [m[1].content[:50] for m in full_thread])
         return full_thread[-1][1]  # Return the GLMessage for the original message
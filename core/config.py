@@ -26,6 +26,14 @@ CACHE_CONVERSATIONS_LEN = 100
 CACHE_CONVERSATIONS_TIMELIMIT_MINS = 120
 CACHE_MESSAGE_LEN = 1000
 
+CACHE_COMPLETIONS_LEN = 1024
+CACHE_COMPLETIONS_TIMELIMIT_MINS = 60
+
+OAI_MAX_CONCURRENT_REQUESTS = 250
+OAI_MAX_RPM = 5000              # OpenAI requests-per-minute budget
+OAI_MAX_TPM = 15_000_000        # OpenAI tokens-per-minute budget
+OAI_MAX_RETRIES = 5             # Retry attempts for transient API errors
+
 MAX_SEARCH_RESULTS = 5
 
 if not DISCORD_API_TOKEN:
@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+class TokenBucket:
+    """Token-bucket throttle for OpenAI's requests-per-minute and tokens-per-minute limits.
+
+    Both budgets refill continuously at their per-minute rate. `acquire` blocks the
+    calling task until one request plus the estimated token cost fits in the budget,
+    so bursts of Discord events drain smoothly instead of tripping 429s.
+    """
+
+    def __init__(self, max_rpm: int, max_tpm: int):
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self._request_budget = float(max_rpm)
+        self._token_budget = float(max_tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Top up both budgets based on the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_budget = min(float(self.max_rpm), self._request_budget + elapsed * self.max_rpm / 60.0)
+        self._token_budget = min(float(self.max_tpm), self._token_budget + elapsed * self.max_tpm / 60.0)
+
+    async def acquire(self, est_tokens: int):
+        """Block until one request and `est_tokens` worth of budget are available.
+
+        Args:
+            est_tokens (int): Estimated prompt + completion tokens for the request.
+        """
+        async with self._lock:  # Serialize waiters so budget is handed out in arrival order
+            while True:
+                self._refill()
+                if self._request_budget >= 1 and self._token_budget >= est_tokens:
+                    self._request_budget -= 1
+                    self._token_budget -= est_tokens
+                    return
+                # Sleep just long enough for the tighter of the two budgets to refill
+                request_wait = (1 - self._request_budget) * 60.0 / self.max_rpm
+                token_wait = (est_tokens - self._token_budget) * 60.0 / self.max_tpm
+                await asyncio.sleep(max(request_wait, token_wait))
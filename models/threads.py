@@ -62,10 +62,10 @@ class GLConversation:
     def add_message(self, message: GLMessage) -> bool:
         try:
             self.message_history.append(message)
-            logger.debug(f"Message {message.message_id} added to conversation.")
+            logger.debug("Message %s added to conversation.", message.message_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to add message {message.message_id}: {e}")
+            logger.error("Failed to add message %s: %s", message.message_id, e)
             return False
 
     def get_messages(self) -> List[GLMessage]:
@@ -78,26 +78,26 @@ class GLConversation:
     def delete_message_by_id(self, message_id: int) -> bool:
         found = any(msg.message_id == message_id for msg in self.message_history)
         if not found:
-            logger.debug(f"Message {message_id} not found in conversation.")
+            logger.debug("Message %s not found in conversation.", message_id)
             return False
         self.message_history = deque(
             (msg for msg in self.message_history if msg.message_id != message_id),
             maxlen=self.message_history.maxlen
         )
-        logger.debug(f"Deleted message {message_id} from conversation.")
+        logger.debug("Deleted message %s from conversation.", message_id)
         return True
 
     def delete_message_by_timestamp(self, timestamp: datetime, tolerance_ms: int = 100) -> bool:
         tol_ms = timedelta(milliseconds=tolerance_ms)
         found = any(abs(msg.timestamp - timestamp) <= tol_ms for msg in self.message_history)
         if not found:
-            logger.debug(f"No message with timestamp {timestamp} within tolerance found.")
+            logger.debug("No message with timestamp %s within tolerance found.", timestamp)
             return False
         self.message_history = deque(
             (msg for msg in self.message_history if abs(msg.timestamp - timestamp) > tol_ms),
             maxlen=self.message_history.maxlen
         )
-        logger.debug(f"Deleted message with timestamp {timestamp} from conversation.")
+        logger.debug("Deleted message with timestamp %s from conversation.", timestamp)
         return True
 
     def delete_all_messages(self) -> bool:
@@ -137,12 +137,12 @@ class GLThread:
         try:
             result = self.conversation.add_message(message)
             if result:
-                logger.debug(f"Added message {message.message_id} to conversation.")
+                logger.debug("Added message %s to conversation.", message.message_id)
             else:
-                logger.error(f"Failed to add message {message.message_id} to conversation.")
+                logger.error("Failed to add message %s to conversation.", message.message_id)
             return result
         except Exception as e:
-            logger.error(f"Exception when adding message {message.message_id}: {e}")
+            logger.error("Exception when adding message %s: %s", message.message_id, e)
             return False
         
     def contains_message(self, message_id: int) -> bool:
@@ -153,18 +153,18 @@ class GLThread:
         """Delete a message in the conversation by its unique ID."""
         result = self.conversation.delete_message_by_id(message_id)
         if result:
-            logger.debug(f"Deleted message {message_id} from conversation.")
+            logger.debug("Deleted message %s from conversation.", message_id)
         else:
-            logger.debug(f"Message {message_id} not found in conversation.")
+            logger.debug("Message %s not found in conversation.", message_id)
         return result
 
     def delete_message_by_timestamp(self, timestamp: datetime, tolerance_ms: int = 100) -> bool:
         """Delete a message in the conversation by its timestamp, with a given tolerance."""
         result = self.conversation.delete_message_by_timestamp(timestamp, tolerance_ms)
         if result:
-            logger.debug(f"Deleted message with timestamp {timestamp} from conversation.")
+            logger.debug("Deleted message with timestamp %s from conversation.", timestamp)
         else:
-            logger.debug(f"No message with timestamp {timestamp} within tolerance found in conversation.")
+            logger.debug("No message with timestamp %s within tolerance found in conversation.", timestamp)
         return result
 
     def clear_conversation(self) -> bool:
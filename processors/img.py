@@ -1,12 +1,12 @@
 from core.config import IMG_MODEL_ID
 import threading
 from clients.openai_client import OpenAIClient
-import base64
 import aiofiles
 import tempfile
 import os
 import aiohttp
 import logging
+from typing import Optional
 from PIL import Image
 
 logger = logging.getLogger("ImageProcessor")
@@ -39,6 +39,38 @@ class ImageProcessor:
         Returns:
             str: The description of the image content.
         """
+        image_bytes = await self._fetch_image_bytes(image_url, is_gif)
+        if not image_bytes:
+            return "No Description Available"
+
+        # Call Image Describer from OpenAI client and return result
+        description = await self.openai_client.image_describer(image_bytes)
+        return description if description else "No Description Available"
+
+    async def summarize_image(self, image_url: str, is_gif=False) -> str:
+        """Process an image from its URL and return a one-sentence summary of the content.
+        Uses a single fused OpenAI call instead of describing and then summarizing.
+        Args:
+            image_url (str): The URL of the image to process.
+            is_gif (bool): Whether the image is a GIF.
+        Returns:
+            str: The one-sentence summary of the image content.
+        """
+        image_bytes = await self._fetch_image_bytes(image_url, is_gif)
+        if not image_bytes:
+            return "No Description Available"
+
+        summary = await self.openai_client.image_summary(image_bytes)
+        return summary if summary else "No Description Available"
+
+    async def _fetch_image_bytes(self, image_url: str, is_gif=False) -> Optional[bytes]:
+        """Download an image (extracting the first frame for GIFs) and return its raw bytes.
+        Args:
+            image_url (str): The URL of the image to download.
+            is_gif (bool): Whether the image is a GIF.
+        Returns:
+            Optional[bytes]: The image bytes, or None if the download failed.
+        """
         with tempfile.TemporaryDirectory() as temp_dir:
             image_path = os.path.join(temp_dir, "image.jpg") if not is_gif else os.path.join(temp_dir, "image.gif")
             
@@ -53,7 +85,7 @@ class ImageProcessor:
                             await f.write(await response.read())
             except Exception as e:
                 logger.error(f"Error downloading image: {str(e)}")
-                return "No Description Available"
+                return None
             
             # If we downloaded a GIF, extract the first frame
             if is_gif:
@@ -65,15 +97,11 @@ class ImageProcessor:
                         gif.convert('RGB').save(image_path, "JPEG")
                 except Exception as e:
                     logger.error(f"Error extracting first frame from GIF: {str(e)}")
-                    return "No Description Available"
-            
-            # Encode the image to base64
-            async with aiofiles.open(image_path, "rb") as image_file:
-                base64_str = base64.b64encode(await image_file.read()).decode('utf-8')
+                    return None
 
-                # Call Image Describer from OpenAI client and return result
-                description =  await self.openai_client.image_describer(base64_str)
-                return description if description else "No Description Available"
+            # Hand the raw bytes back; the OpenAI client downscales and encodes them
+            async with aiofiles.open(image_path, "rb") as image_file:
+                return await image_file.read()
 
 
 
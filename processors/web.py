@@ -3,6 +3,7 @@ from core.config import MAX_SEARCH_RESULTS
 from typing import List, Tuple, Dict
 from clients.openai_client import OpenAIClient
 import aiohttp
+import asyncio
 from bs4 import BeautifulSoup
 import logging
 from duckduckgo_search import AsyncDDGS
@@ -39,8 +40,12 @@ class WebProcessor:
         """
         logger.info(f"Searching webpage '{url}'...")
         title, description, page_content = await self._extract_web_data_from_page(url)
-        url_description = await self.openai_client.link_summarizer(url)
-        page_content_summarized = await self.openai_client.text_summarizer(page_content)
+
+        # The two summaries are independent, so fire them concurrently
+        url_description, page_content_summarized = await asyncio.gather(
+            self.openai_client.link_summarizer(url),
+            self.openai_client.text_summarizer(page_content)
+        )
 
         website = {
             "title": title,
@@ -56,11 +56,10 @@ class YouTubeProcessor:
             logger.error("Failed to search YouTube.")
             return None
         
-        # Process thumbnail for a description and add it to the video dictionary
+        # Process thumbnail for a one-sentence summary and add it to the video dictionary.
+        # One fused OpenAI call replaces the old describe-then-summarize chain.
         thumbnail_url = video.get("thumbnail_url")
-        thumbnail_description = await self.img_processor.describe_image(thumbnail_url) if thumbnail_url else "No Thumbnail Description Available"
-        if thumbnail_description:
-            thumbnail_description = await self.openai_client.text_summarizer(thumbnail_description)
+        thumbnail_description = await self.img_processor.summarize_image(thumbnail_url) if thumbnail_url else "No Thumbnail Description Available"
         video["thumbnail_description"] = thumbnail_description
 
         # Also summarize the video's description